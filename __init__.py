@@ -1,8 +1,8 @@
 from .watch_point import NODE_CLASS_MAPPINGS as WP_CLASS, NODE_DISPLAY_NAME_MAPPINGS as WP_DISPLAY, cleanup_all_watchpoints
 
 # Merge node mappings
-NODE_CLASS_MAPPINGS = {**WP_CLASS}
-NODE_DISPLAY_NAME_MAPPINGS = {**WP_DISPLAY}
+NODE_CLASS_MAPPINGS = WP_CLASS.copy()
+NODE_DISPLAY_NAME_MAPPINGS = WP_DISPLAY.copy()
 
 # JS directory for floating preview functionality
 WEB_DIRECTORY = "js" 
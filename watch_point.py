@@ -1,15 +1,20 @@
 import os
+import base64
 import json
 import sys
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import Image
 import numpy as np
-from threading import Thread, Lock
+import torch
+from threading import Thread, Lock, current_thread
 import folder_paths
-import io
+import itertools
+import queue
+import struct
 import time
 import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 try:
     import ctypes
     if sys.platform.startswith("win"):
@@ -18,11 +23,34 @@ try:
 except ImportError:
     CTYPES_AVAILABLE = False
 
+# Paths resolved once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_ICON_PATH = os.path.join(_MODULE_DIR, "preview_monitor_icon.png")
+_SETTINGS_PATH = os.path.join(_MODULE_DIR, "watchpoint_settings.json")
+_ICON_DATA = None  # base64 icon bytes once read; False if the file is missing
+
+# Tk is imported on first window creation (_load_tk); headless runs never load it
+tk = filedialog = messagebox = ImageTk = None
+
+def _load_tk():
+    """Imports tkinter and PIL.ImageTk into the module globals on first use."""
+    global tk, filedialog, messagebox, ImageTk
+    if tk is None:
+        import tkinter
+        from tkinter import filedialog as _filedialog, messagebox as _messagebox
+        from PIL import ImageTk as _ImageTk
+        filedialog, messagebox, ImageTk = _filedialog, _messagebox, _ImageTk
+        tk = tkinter  # Set last: other threads check tk to see the imports are done
+
+# Floating previews are throwaway temp files: favour encode speed over size
+PREVIEW_PNG_COMPRESS_LEVEL = 1
+PREVIEW_JPEG_QUALITY = 85
+
 # Global Shutdown Registry
 class ShutdownRegistry:
     """Global registry to handle shutdown without atexit"""
     _instance = None
-    _nodes = []
+    _nodes = weakref.WeakSet()  # Does not keep discarded nodes alive
     _shutdown_called = False
     
     def __new__(cls):
@@ -33,22 +61,29 @@ class ShutdownRegistry:
     def register(self, node):
         """Register a node for cleanup"""
         if not self._shutdown_called:
-            self._nodes.append(node)
+            self._nodes.add(node)
     
     def shutdown_all(self):
-        """Shutdown all registered nodes"""
+        """Shutdown all registered nodes, then the shared window manager"""
         if self._shutdown_called:
             return
         self._shutdown_called = True
         
         wp_logger.info(f"Cleaning up {len(self._nodes)} nodes...", "ShutdownRegistry")
-        for node in self._nodes[:]:
+        for node in list(self._nodes):
             try:
                 if hasattr(node, 'cleanup'):
                     node.cleanup()
             except Exception as e:
                 wp_logger.error(f"Error in cleanup: {e}", "ShutdownRegistry")
         self._nodes.clear()
+        
+        # The window outlives its nodes, so it is shut down here even if none are left
+        try:
+            window_manager.shutdown()
+        except Exception as e:
+            wp_logger.error(f"Error shutting down window manager: {e}", "ShutdownRegistry")
+        _PREVIEW_POOL.shutdown(wait=False)
 
 # Create global instance
 shutdown_registry = ShutdownRegistry()
@@ -57,23 +92,48 @@ shutdown_registry = ShutdownRegistry()
 class WatchPointLogger:
     """Structured logging system for WatchPoint"""
     
+    _LEVELS = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+    
     def __init__(self):
         self.enabled = True
         self.log_level = "INFO"  # DEBUG, INFO, WARNING, ERROR
-        self.logs = []
         self.max_logs = 100
+        self.logs = deque(maxlen=self.max_logs)
+        
+        # Formatted timestamp cached per whole second
+        self._ts_epoch = 0
+        self._ts_str = ""
+        
+        # Console output is written in batches by a background thread
+        self._err = sys.stderr
+        self._log_queue = queue.Queue(maxsize=4096)
+        self._writer_thread = Thread(target=self._writer_loop, name="WatchPointLogWriter", daemon=True)
+        self._writer_thread.start()
+    
+    @property
+    def log_level(self):
+        return self._log_level
+    
+    @log_level.setter
+    def log_level(self, value):
+        """Set the level name and precompute its numeric threshold"""
+        self._log_level = value
+        self._threshold = self._LEVELS.get(value, 1)
     
     def log(self, level, message, component="WatchPoint"):
         """Log a message with level and component"""
-        if not self.enabled:
+        if not self.enabled or self._LEVELS.get(level, 1) < self._threshold:
             return
         
-        # Check log level
-        levels = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
-        if levels.get(level, 1) < levels.get(self.log_level, 1):
-            return
+        # Deferred messages are only formatted once they pass the level gate
+        if callable(message):
+            message = message()
         
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        now = int(time.time())
+        if now != self._ts_epoch:
+            self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._ts_epoch = now
+        timestamp = self._ts_str
         log_entry = {
             "timestamp": timestamp,
             "level": level,
@@ -81,21 +141,57 @@ class WatchPointLogger:
             "message": message
         }
         
+        # Oldest entries are evicted automatically once max_logs is reached
         self.logs.append(log_entry)
         
-        # Keep only the latest logs
-        if len(self.logs) > self.max_logs:
-            self.logs.pop(0)
-        
-        # Always print errors
-        if level == "ERROR":
-            print(f"WatchPoint [{timestamp}] {level}: {message}")
-        elif level == "WARNING":
-            print(f"WatchPoint [{timestamp}] {level}: {message}")
+        # Always print errors and warnings (dropped if the writer falls behind)
+        if level in ("ERROR", "WARNING"):
+            try:
+                self._log_queue.put_nowait(log_entry)
+            except queue.Full:
+                pass
+    
+    def _writer_loop(self):
+        """Drain queued console entries in batches; a queued Event marks a flush point"""
+        while True:
+            batch = [self._log_queue.get()]
+            try:
+                while len(batch) < 64 and not isinstance(batch[-1], threading.Event):
+                    batch.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            marker = batch.pop() if isinstance(batch[-1], threading.Event) else None
+            if batch:
+                self._write_batch(batch)
+            if marker:
+                marker.set()
+    
+    def _write_batch(self, batch):
+        """Write a batch of entries to the console in a single call"""
+        lines = [f"WatchPoint [{e['timestamp']}] {e['level']}: {e['message']}\n" for e in batch]
+        try:
+            self._err.write("".join(lines))
+            if any(e["level"] == "ERROR" for e in batch):
+                self._err.flush()
+        except Exception:
+            pass
+    
+    def flush(self, timeout=1.0):
+        """Wait until the writer thread has printed everything queued so far"""
+        done = threading.Event()
+        try:
+            self._log_queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
     
     def debug(self, message, component="WatchPoint"):
         self.log("DEBUG", message, component)
     
+    def debug_lazy(self, fn, component="WatchPoint"):
+        """Like debug(), but fn() builds the message only if DEBUG is enabled"""
+        self.log("DEBUG", fn, component)
+    
     def info(self, message, component="WatchPoint"):
         self.log("INFO", message, component)
     
@@ -107,7 +203,7 @@ class WatchPointLogger:
         
     def get_logs(self, level=None, component=None):
         """Get filtered logs by level and component"""
-        filtered_logs = self.logs
+        filtered_logs = list(self.logs)
         
         if level:
             filtered_logs = [log for log in filtered_logs if log["level"] == level]
@@ -119,7 +215,7 @@ class WatchPointLogger:
     
     def clear_logs(self):
         """Clear all logs"""
-        self.logs = []
+        self.logs.clear()
 
 
 # Create global logger
@@ -139,6 +235,43 @@ try:
 except ImportError:
     SCREENINFO_AVAILABLE = False
 
+# Monitor enumeration queries the OS; reuse the result for a few seconds
+_MONITORS_CACHE = {"ts": 0.0, "val": None}
+
+def _cached_monitors():
+    """Returns get_monitors(), re-querying at most every 5 seconds."""
+    now = time.monotonic()
+    if _MONITORS_CACHE["val"] is None or now - _MONITORS_CACHE["ts"] >= 5.0:
+        _MONITORS_CACHE["val"] = get_monitors()
+        _MONITORS_CACHE["ts"] = now
+    return _MONITORS_CACHE["val"]
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    import fpnge
+    FPNGE_AVAILABLE = True
+except ImportError:
+    FPNGE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # Per-window lock only; FastRLock is reentrant (a fast substitute for RLock)
+    from fastrlock.rlock import FastRLock as _WindowLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    _WindowLock = Lock
+    FASTRLOCK_AVAILABLE = False
+
 
 class Tooltip:
     def __init__(self, widget, text):
@@ -195,24 +328,39 @@ class SettingsManager:
             "show_toolbar": True, "save_format": "png", "jpeg_quality": 90,
             "start_fullscreen": False,
             "monitor_index": 0,
+            "preview_format": "jpeg",
         }
+        self._last_saved = None  # Bytes of the settings file as last read or written
         self.settings = self.load()
 
     def load(self):
         """Loads settings from the file, merging with defaults."""
         try:
             if os.path.exists(self.filepath):
-                with open(self.filepath, 'r') as f:
-                    return {**self.defaults, **json.load(f)}
+                with open(self.filepath, 'rb') as f:
+                    raw = f.read()
+                data = json.loads(raw)
+                self._last_saved = raw  # An unchanged first save() then skips the write
+                return {**self.defaults, **data}
         except Exception as e:
             print(f"Watch Point: Error loading settings, using defaults. Error: {e}")
         return self.defaults.copy()
 
     def save(self):
-        """Saves the current settings to the file."""
+        """Saves the current settings to the file, skipping the write if nothing changed."""
         try:
-            with open(self.filepath, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.settings, indent=2).encode("utf-8")
+            if data == self._last_saved:
+                return
+            # Write to a temp file and swap it in so readers never see a partial file
+            tmp_path = self.filepath + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.filepath)
+            self._last_saved = data
         except Exception as e:
             print(f"Watch Point: Could not save settings. Error: {e}")
 
@@ -225,6 +373,24 @@ class SettingsManager:
         self.settings[key] = value
 
 # Window Management
+class WindowState:
+    """State of one preview window, shared by the ComfyUI, Tk and watchdog threads."""
+    __slots__ = ("display_idx", "image", "lock", "running", "closing", "close_started",
+                 "instance", "pending_text", "minimized", "thread", "dirty")
+
+    def __init__(self, display_idx, image, pending_text=None):
+        self.display_idx = display_idx
+        self.image = image
+        self.lock = _WindowLock()
+        self.running = True
+        self.closing = False
+        self.close_started = None
+        self.instance = None
+        self.pending_text = pending_text
+        self.minimized = False
+        self.thread = None
+        self.dirty = image is not None
+
 class WindowManager:
     """Manages the lifecycle and state of all Tkinter preview windows."""
     _instance = None
@@ -237,10 +403,15 @@ class WindowManager:
     def __init__(self, settings_manager=None):
         if not hasattr(self, 'initialized'):
             self.windows = {}
-            self.settings_manager = settings_manager or SettingsManager(
-                os.path.join(os.path.dirname(__file__), "watchpoint_settings.json")
-            )
+            # Guards read-modify-write on self.windows; never held across joins or Tk calls
+            self._windows_lock = Lock()
+            self.settings_manager = settings_manager or SettingsManager(_SETTINGS_PATH)
             self.shutdown_event = threading.Event()
+            # Wakes the watchdog early when windows are created or closed
+            self._watchdog_wake = threading.Event()
+            self._poll_interval = 0.25
+            # Saves from the window run here so encoding never blocks the Tk loop
+            self.io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WatchPointSave")
             self._start_time = time.time()  # Start time for statistics
             self.initialized = True
             
@@ -256,28 +427,40 @@ class WindowManager:
         target_monitor_idx = self.settings_manager.get("monitor_index", 0)
         
         # Check if any window exists, reuse it
-        if len(self.windows) > 0:
-            # Get the index of the existing window (there should only be 1)
-            existing_idx = list(self.windows.keys())[0]
-            win_data = self.windows[existing_idx]
+        with self._windows_lock:
+            existing = next(iter(self.windows.items()), None)
+        if existing:
+            # Get the existing window (there should only be 1)
+            existing_idx, win_data = existing
             
             # Check that the window is running
-            if not win_data.get("running", False):
+            if not win_data.running:
                 # Window exists but is dead, clean up
                 wp_logger.warning(f"Window {existing_idx} exists but is not running, cleaning up", "ShowImage")
                 self._cleanup_window(existing_idx)
                 # Continue to create new window (below)
             else:
                 # Window is alive, REUSE
-                wp_logger.debug(f"Reusing existing window {existing_idx} for new image", "ShowImage")
+                wp_logger.debug_lazy(lambda: f"Reusing existing window {existing_idx} for new image", "ShowImage")
                 
-                # Update image
-                with win_data["lock"]:
-                    win_data["image"] = pil_img
+                # Publish image; the Tk side renders only when dirty
+                if win_data.lock.acquire(blocking=False):
+                    try:
+                        win_data.image = pil_img
+                        win_data.dirty = True
+                    finally:
+                        win_data.lock.release()
+                else:
+                    # Tk side holds the lock: don't wait. Image before flag, and the reader
+                    # clears the flag before reading the image, so no frame is lost
+                    win_data.image = pil_img
+                    win_data.dirty = True
+                if win_data.instance:
+                    win_data.instance.notify_image()
                 
                 # Update text if it exists
-                if text and win_data.get("instance"):
-                    win_data["instance"].update_signal_text(text)
+                if text and win_data.instance:
+                    win_data.instance.update_signal_text(text)
                 
                 # Update monitor if changed
                 if existing_idx != target_monitor_idx:
@@ -285,30 +468,33 @@ class WindowManager:
                     wp_logger.info(f"Monitor changed from {existing_idx} to {target_monitor_idx} - Moving Window", "ShowImage")
                     
                     # Move data to new key
-                    self.windows[target_monitor_idx] = self.windows.pop(existing_idx)
-                    win_data = self.windows[target_monitor_idx]
+                    with self._windows_lock:
+                        self.windows[target_monitor_idx] = self.windows.pop(existing_idx)
+                        win_data.display_idx = target_monitor_idx
+                    instance = win_data.instance
                     
-                    if win_data.get("instance"):
-                        win_data["instance"].display_idx = target_monitor_idx
+                    if instance:
+                        instance.display_idx = target_monitor_idx
+                        instance._geom_cache.clear()  # Screen-relative sizes depend on the monitor
                         
                         # Handle fullscreen move
                         was_fullscreen = False
-                        if hasattr(win_data["instance"], "fullscreen_active") and win_data["instance"].fullscreen_active:
+                        if instance.fullscreen_active:
                             was_fullscreen = True
                             # Disable fullscreen to allow move
-                            win_data["instance"]._set_fullscreen(False)
+                            instance._set_fullscreen(False)
 
                         # Move the window
                         try:
-                            self._apply_geometry(win_data["instance"].root, target_monitor_idx)
+                            self._apply_geometry(instance.root, target_monitor_idx)
                         except Exception as e:
                             wp_logger.error(f"Error moving window: {e}", "ShowImage")
                         
                         # Re-enable fullscreen if needed (now on new monitor)
                         if was_fullscreen:
                             try:
-                                win_data["instance"].root.update_idletasks()
-                                win_data["instance"]._set_fullscreen(True)
+                                instance.root.update_idletasks()
+                                instance._set_fullscreen(True)
                             except Exception as e:
                                 wp_logger.warning(f"Error restoring fullscreen after move: {e}", "ShowImage")
                 
@@ -318,28 +504,26 @@ class WindowManager:
         wp_logger.info(f"Creating new global window on Monitor {target_monitor_idx}", "ShowImage")
         display_idx = target_monitor_idx
         
-        lock = Lock()
-        win_data = {
-            "image": pil_img, "lock": lock, "running": True,
-            "instance": None, "pending_text": text,
-            "minimized": False
-        }
-        self.windows[display_idx] = win_data
-        
-        thread = Thread(target=self._window_loop, args=(display_idx,), daemon=True)
-        win_data["thread"] = thread
-        thread.start()
+        win_data = WindowState(display_idx, pil_img, text)
+        with self._windows_lock:
+            # The thread gets its state directly; the entry may be removed before it runs
+            win_data.thread = Thread(target=self._window_loop, args=(display_idx, win_data), daemon=True)
+            self.windows[display_idx] = win_data
+        win_data.thread.start()
+        self._watchdog_wake.set()
 
     def hide_window(self, display_idx):
         """Signals a window to close with guaranteed timeout."""
-        if display_idx in self.windows:
-            self.windows[display_idx]["running"] = False
-            self.windows[display_idx]["closing"] = True
-            self.windows[display_idx]["close_started"] = time.time()
+        win_data = self.windows.get(display_idx)
+        if win_data:
+            win_data.running = False
+            win_data.closing = True
+            win_data.close_started = time.time()
+            self._watchdog_wake.set()
             
             
+            thread = win_data.thread
             try:
-                thread = self.windows[display_idx].get("thread")
                 if thread and thread.is_alive():
                     thread.join(timeout=3.0)
                     wp_logger.debug(f"Thread {display_idx} finished successfully", "HideWindow")
@@ -347,22 +531,25 @@ class WindowManager:
                 wp_logger.error(f"Error waiting for thread {display_idx}: {e}", "HideWindow")
             
             # Force cleanup if thread is still alive
-            if display_idx in self.windows and self.windows[display_idx].get("thread", {}).is_alive():
+            if display_idx in self.windows and thread and thread.is_alive():
                 wp_logger.warning(f"Forcing cleanup for window {display_idx}", "HideWindow")
                 self._force_cleanup_window(display_idx)
 
     def update_all_text(self, text):
         """Updates the text in all currently open windows."""
-        for win_data in self.windows.values():
-            if win_data.get("running") and win_data.get("instance"):
-                win_data["instance"].update_signal_text(text)
+        with self._windows_lock:
+            open_windows = list(self.windows.values())
+        for win_data in open_windows:
+            if win_data.running and win_data.instance:
+                win_data.instance.update_signal_text(text)
 
-    def _window_loop(self, display_idx):
+    def _window_loop(self, display_idx, win_data):
         """The main loop for a Tkinter window thread with robust error handling."""
         root = None
         win_instance = None
         try:
             # Create main window
+            _load_tk()
             root = tk.Tk()
             root.title("Watch Point")
             
@@ -370,7 +557,7 @@ class WindowManager:
             self._apply_geometry(root, display_idx)
 
             win_instance = WatchPointWindow(root, display_idx, self)
-            self.windows[display_idx]["instance"] = win_instance
+            win_data.instance = win_instance
             
             # NEW: Close handler that minimizes instead of closing - Accidental close protection!
             def safe_close():
@@ -378,15 +565,15 @@ class WindowManager:
                 try:
                     root.iconify()  # Minimize to taskbar
                     # Update state: window is still alive but minimized
-                    self.windows[display_idx]["minimized"] = True
-                    self.windows[display_idx]["running"] = True  # Still running
+                    win_data.minimized = True
+                    win_data.running = True  # Still running
                     wp_logger.info(f"Window {display_idx} minimized (protected from accidental close)", "WindowLoop")
                 except Exception as e:
                     wp_logger.warning(f"Error minimizing window {display_idx}: {e}", "WindowLoop")
                     # Fallback: if cannot minimize, try to hide
                     try:
                         root.withdraw()
-                        self.windows[display_idx]["minimized"] = True
+                        win_data.minimized = True
                         wp_logger.info(f"Window {display_idx} hidden as fallback", "WindowLoop")
                     except:
                         pass
@@ -402,7 +589,7 @@ class WindowManager:
                     wp_logger.error(f"RuntimeError in mainloop: {e}", "WindowLoop")
                     raise
                 else:
-                    wp_logger.debug(f"Expected RuntimeError in mainloop: {e}", "WindowLoop")
+                    wp_logger.debug_lazy(lambda: f"Expected RuntimeError in mainloop: {e}", "WindowLoop")
             except Exception as e:
                 wp_logger.error(f"Error in Tkinter mainloop: {e}", "WindowLoop")
         
@@ -410,55 +597,46 @@ class WindowManager:
             wp_logger.error(f"Error in window {display_idx}: {e}", "WindowLoop")
         
         finally:
-            # IMPROVED: Cleanup with multiple attempts and Tkinter cleanup
+            # Single-attempt cleanup of Tkinter resources and window state
             # CRITICAL: Only the main thread can touch Tkinter resources
-            import threading
-            current_thread = threading.current_thread()
+            this_thread = current_thread()
             
-            for attempt in range(3):
+            if this_thread.name != "MainThread":
+                # TCL PROTECTION: If not in main thread, just log and skip Tkinter cleanup
+                wp_logger.warning(f"Skipping Tkinter cleanup from thread {this_thread.name} - Tcl_AsyncDelete protection", "WindowLoop")
+            else:
                 try:
-                    # TCL PROTECTION: Only clean Tkinter if we're in the main thread
-                    if current_thread.name == "MainThread":
-                        # Clean Tkinter resources first
-                        if win_instance:
-                            try:
-                                win_instance.cleanup_tkinter_resources()
-                            except Exception as e:
-                                wp_logger.warning(f"Error cleaning up Tkinter resources: {e}", "WindowLoop")
-                        
-                        if root:
-                            try:
-                                root.quit()
-                            except:
-                                pass
-                            try:
-                                root.destroy()
-                            except:
-                                pass
-                    else:
-                        # If not in main thread, just log and skip Tkinter cleanup
-                        wp_logger.warning(f"Skipping Tkinter cleanup from thread {current_thread.name} - Tcl_AsyncDelete protection", "WindowLoop")
-                        continue
+                    # Clean Tkinter resources first
+                    if win_instance:
+                        try:
+                            win_instance.cleanup_tkinter_resources()
+                        except Exception as e:
+                            wp_logger.warning(f"Cleanup error in Tkinter resources: {e}", "WindowLoop")
+                    
+                    if root:
+                        try:
+                            root.quit()
+                        except:
+                            pass
+                        try:
+                            root.destroy()
+                        except:
+                            pass
                     
-                    # If in main thread, try cleanup
                     self._cleanup_window(display_idx)
-                    break
                 except Exception as e:
-                    if attempt == 2:
-                        wp_logger.error(f"Cleanup failed after 3 attempts: {e}", "WindowLoop")
-                    time.sleep(0.05)
+                    wp_logger.error(f"Cleanup failed: {e}", "WindowLoop")
 
     def restore_window(self, display_idx):
         """Restore a minimized window - To recover it from the taskbar!"""
-        if display_idx in self.windows:
-            win_data = self.windows[display_idx]
-            
+        win_data = self.windows.get(display_idx)
+        if win_data:
             # Check if it's minimized
-            if not win_data.get("minimized", False):
+            if not win_data.minimized:
                 wp_logger.debug(f"Window {display_idx} is not minimized", "RestoreWindow")
                 return False
             
-            instance = win_data.get("instance")
+            instance = win_data.instance
             if not instance:
                 wp_logger.warning(f"Cannot restore window {display_idx}: invalid instance", "RestoreWindow")
                 return False
@@ -471,7 +649,7 @@ class WindowManager:
                     instance.root.focus_force()  # Give focus
                     
                     # Update state
-                    win_data["minimized"] = False
+                    win_data.minimized = False
                     wp_logger.info(f"Window {display_idx} restored successfully", "RestoreWindow")
                 return True
                 
@@ -484,12 +662,19 @@ class WindowManager:
 
     def _apply_icon(self, root):
         """Applies the icon from a file to the window."""
+        global _ICON_DATA
+        if _ICON_DATA is None:
+            # Read once; PhotoImages are per-interpreter but the bytes can be shared
+            try:
+                with open(_ICON_PATH, "rb") as f:
+                    _ICON_DATA = base64.b64encode(f.read())
+            except OSError:
+                _ICON_DATA = False
+        if not _ICON_DATA:
+            return
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            icon_path = os.path.join(script_dir, "preview_monitor_icon.png")
-            if os.path.exists(icon_path):
-                icon_img = tk.PhotoImage(file=icon_path)
-                root.iconphoto(True, icon_img)
+            icon_img = tk.PhotoImage(data=_ICON_DATA)
+            root.iconphoto(True, icon_img)
         except tk.TclError:
             print("Watch Point: Could not apply icon. Ensure it's a valid PNG/GIF.")
 
@@ -507,7 +692,7 @@ class WindowManager:
         position_set = False
         if SCREENINFO_AVAILABLE:
             try:
-                m = get_monitors()[display_idx]
+                m = _cached_monitors()[display_idx]
                 root.geometry(f"+{m.x}+{m.y}")
                 position_set = True
             except IndexError:
@@ -539,105 +724,128 @@ class WindowManager:
         return f"{default_w}x{default_h}"
 
     def _cleanup_window(self, display_idx):
-        """Ensures a window and its resources are properly removed with multiple attempts."""
-        if display_idx in self.windows:
-            import threading
-            current_thread = threading.current_thread()
+        """Ensures a window and its resources are properly removed."""
+        win_data = self.windows.get(display_idx)
+        if win_data:
+            this_thread = current_thread()
+            try:
+                # THREAD PROTECTION: Only try to join if current thread is NOT the window thread
+                if win_data.thread and win_data.thread.is_alive():
+                    # Verify we are not attempting to join ourselves
+                    if win_data.thread != this_thread:
+                        try:
+                            win_data.thread.join(timeout=0.1)
+                        except Exception: 
+                            pass
+                    else:
+                        wp_logger.warning(f"Avoiding self-join in cleanup for window {display_idx}", "Cleanup")
+            except Exception as e:
+                wp_logger.error(f"Cleanup failed: {e}", "Cleanup")
             
-            for attempt in range(3):
-                try:
-                    win_data = self.windows[display_idx]
-                    
-                    # THREAD PROTECTION: Only try to join if current thread is NOT the window thread
-                    if "thread" in win_data and win_data["thread"].is_alive():
-                        # Verify we are not attempting to join ourselves
-                        if win_data["thread"] != current_thread:
-                            try:
-                                win_data["thread"].join(timeout=0.1)
-                            except Exception: 
-                                pass
-                        else:
-                            wp_logger.warning(f"Avoiding self-join in cleanup for window {display_idx}", "Cleanup")
-                    
-                    # Remove from list ALWAYS, even if errors occur
-                    try:
-                        del self.windows[display_idx]
-                    except KeyError:
-                        # Already removed, not an error
-                        pass
-                    
-                    # Log success after successful cleanup
-                    wp_logger.debug(f"Successfully cleaned up window {display_idx} (attempt {attempt + 1})", "Cleanup")
-                    break
-                except Exception as e:
-                    if attempt == 2:
-                        wp_logger.error(f"Cleanup failed after 3 attempts: {e}", "Cleanup")
-                    time.sleep(0.05)
+            # Remove from list ALWAYS, even if errors occur
+            with self._windows_lock:
+                if self.windows.get(display_idx) is win_data:
+                    del self.windows[display_idx]
+            wp_logger.debug_lazy(lambda: f"Successfully cleaned up window {display_idx}", "Cleanup")
 
     def _watchdog_loop(self):
-        """Monitor and clean up dead threads every second"""
+        """Monitor and clean up dead threads, backing off while idle"""
         wp_logger.info("Watchdog started", "Watchdog")
         
         while not self.shutdown_event.is_set():
-            time.sleep(1.0)
+            if self._watchdog_wake.wait(timeout=self._poll_interval):
+                self._watchdog_wake.clear()
+                self._poll_interval = 0.25
+            if self.shutdown_event.is_set():
+                break
             
             dead_windows = []
-            for display_idx, win_data in list(self.windows.items()):
+            closing_pending = False
+            # Snapshot under the lock, then inspect without holding it
+            with self._windows_lock:
+                snapshot = list(self.windows.items()) if self.windows else ()
+            for display_idx, win_data in snapshot:
                 # Detect dead threads that didn't clean up
-                if "thread" in win_data:
-                    if not win_data["thread"].is_alive():
-                        dead_windows.append(display_idx)
+                if win_data.thread:
+                    if not win_data.thread.is_alive():
+                        dead_windows.append((display_idx, win_data))
                         wp_logger.warning(f"Dead thread detected for window {display_idx}", "Watchdog")
                     # Detect windows that are taking too long to close
-                    elif win_data.get("closing") and win_data.get("close_started"):
-                        if time.time() - win_data["close_started"] > 5.0:
+                    elif win_data.closing and win_data.close_started:
+                        closing_pending = True
+                        if time.time() - win_data.close_started > 5.0:
                             # Force cleanup after 5 seconds
-                            dead_windows.append(display_idx)
+                            dead_windows.append((display_idx, win_data))
                             wp_logger.warning(f"Window {display_idx} taking too long to close", "Watchdog")
             
             # Clean up dead windows
-            for idx in dead_windows:
+            for idx, win_data in dead_windows:
                 # Log before force cleanup
                 wp_logger.info(f"Force cleaning up dead window {idx}", "Watchdog")
-                self._force_cleanup_window(idx)
+                self._force_cleanup_window(idx, win_data)
+            
+            # Poll quickly while a close is pending, back off otherwise
+            if dead_windows or closing_pending:
+                self._poll_interval = 0.25
+            elif self.windows:
+                self._poll_interval = min(1.0, self._poll_interval * 2)
+            else:
+                self._poll_interval = min(5.0, self._poll_interval * 2)
         
         wp_logger.info("Watchdog finished", "Watchdog")
 
-    def _force_cleanup_window(self, display_idx):
-        """Force cleanup of a window without waiting for the thread"""
-        if display_idx in self.windows:
-            try:
-                # No intentar join, solo eliminar
-                del self.windows[display_idx]
-                # Log success after successful force cleanup
-                wp_logger.debug(f"Successfully force cleaned up window {display_idx}", "Cleanup")
-            except Exception as e:
-                wp_logger.error(f"Error in force cleanup: {e}", "Cleanup")
+    def _force_cleanup_window(self, display_idx, expected=None):
+        """Force cleanup of a window without waiting for the thread.
+
+        If expected is given, the entry is only removed while it is still that window,
+        so a window created on the same monitor in the meantime is left alone.
+        """
+        with self._windows_lock:
+            win_data = self.windows.get(display_idx)
+            if win_data is None or (expected is not None and win_data is not expected):
+                return
+            # No intentar join, solo eliminar
+            del self.windows[display_idx]
+        # Log success after successful force cleanup
+        wp_logger.debug(f"Successfully force cleaned up window {display_idx}", "Cleanup")
 
     def get_health_stats(self):
         """Get health statistics of the system"""
+        # Single pass over a snapshot instead of one list per counter
+        with self._windows_lock:
+            snapshot = list(self.windows.values())
+        active = closing = alive = 0
+        for w in snapshot:
+            active += w.running
+            closing += w.closing
+            alive += bool(w.thread and w.thread.is_alive())
+        
         stats = {
-            "total_windows_created": len(self.windows),
-            "active_windows": len([w for w in self.windows.values() if w.get("running", False)]),
-            "closing_windows": len([w for w in self.windows.values() if w.get("closing", False)]),
-            "threads_alive": len([w for w in self.windows.values() if w.get("thread") and w["thread"].is_alive()]),
+            "total_windows_created": len(snapshot),
+            "active_windows": active,
+            "closing_windows": closing,
+            "threads_alive": alive,
             "watchdog_status": "running" if hasattr(self, 'watchdog_thread') and self.watchdog_thread.is_alive() else "stopped",
             "shutdown_event": self.shutdown_event.is_set(),
             "uptime": time.time() - getattr(self, '_start_time', time.time())
         }
         
         # Add thread information
-        import threading
         stats["total_threads"] = threading.active_count()
         
         return stats
     def shutdown(self):
         """Shutdown global del WindowManager without using atexit"""
+        if self.shutdown_event.is_set():
+            return  # Already shut down (several nodes and the registry may all call this)
         wp_logger.info("Initiating global shutdown...", "WindowManager")
         self.shutdown_event.set()
+        self._watchdog_wake.set()
         
         # Close all active windows
-        for display_idx in list(self.windows.keys()):
+        with self._windows_lock:
+            open_windows = list(self.windows.keys())
+        for display_idx in open_windows:
             try:
                 self.hide_window(display_idx)
             except Exception as e:
@@ -647,17 +855,52 @@ class WindowManager:
         # Wait for the watchdog thread to finish
         try:
             if hasattr(self, 'watchdog_thread') and self.watchdog_thread.is_alive():
-                self.watchdog_thread.join(timeout=2.0)
+                self.watchdog_thread.join(timeout=0.5)
         except Exception as e:
             # Log error if watchdog thread join fails
             wp_logger.error(f"Error waiting for watchdog thread: {e}", "WindowManager")
         
+        # Queued saves still finish; no new ones are accepted
+        self.io_pool.shutdown(wait=False)
+        
         # Log successful shutdown completion
         wp_logger.info("Global shutdown completed successfully", "WindowManager")
+        
+        # The writer is a daemon thread: let it print pending warnings/errors before exit
+        wp_logger.flush()
 
 # Global Window Manager Instance
 window_manager = WindowManager()
 
+# Preview filenames: per-process session stamp plus a call counter, unique without clock reads
+_PREVIEW_SESSION = time.strftime("%Y%m%d%H%M%S")
+_PREVIEW_COUNTER = itertools.count()
+
+# Floating preview encoding runs off the node's execution thread
+# (Pillow releases the GIL while encoding, so batch frames encode in parallel)
+_PREVIEW_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="WatchPointPreview")
+
+def _encode_preview(frame, path, fmt):
+    """Converts one (H, W, C) image tensor to uint8 and encodes it to a temporary preview file.
+
+    Converting per frame in the pool keeps peak memory at a few frames, not the whole batch.
+    """
+    img = Image.fromarray(WatchPoint._to_uint8(frame))
+    if fmt == "png":
+        if FPNGE_AVAILABLE:
+            # SIMD PNG encoder, much faster than zlib on noisy diffusion output
+            with open(path, "wb") as f:
+                f.write(fpnge.fromPIL(img))
+        else:
+            img.save(path, compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
+    elif fmt == "bmp":
+        # Uncompressed: the fastest option, at the cost of much larger temp files
+        img.save(path, "BMP")
+    else:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(path, "JPEG", quality=PREVIEW_JPEG_QUALITY, optimize=False)
+
 # Main ComfyUI Node
 class WatchPoint:
     """The main ComfyUI node class."""
@@ -684,32 +927,42 @@ class WatchPoint:
     CATEGORY = "WatchPoint"
 
     def watch(self, images, floating_preview=True, monitor_preview=True, opt_signal_text=None):
+        # Start encoding the floating preview before updating the monitor window
+        ui_images, pending = self._prepare_preview(images) if floating_preview else ([], [])
+        
         if monitor_preview:
-            image = 255.0 * images[0].cpu().numpy()
-            pil_img = Image.fromarray(np.clip(image, 0, 255).astype(np.uint8))
-            self.window_manager.show_image(pil_img, opt_signal_text)
+            self.window_manager.show_image(Image.fromarray(self._to_uint8(images[0])), opt_signal_text)
         
         # If monitor_preview is False, we do NOTHING.
         # The window remains open (static) if it was already open.
         # We do NOT call hide_window().
 
-        ui_images = self._prepare_preview(images) if floating_preview else []
+        # The frontend fetches the files as soon as the node returns
+        for future in pending:
+            future.result()
         
         return {"ui": {"images": ui_images}, "result": (images,)}
 
+    @staticmethod
+    def _to_uint8(images):
+        """Scales [0, 1] image tensors to a uint8 NumPy array, clamping and casting on the tensor's device."""
+        return images.mul(255.0).clamp_(0, 255).to(torch.uint8).cpu().numpy()
+
     def _prepare_preview(self, images):
-        """Creates temporary files for ComfyUI's floating preview."""
-        import time
+        """Queues temporary files for ComfyUI's floating preview from an IMAGE (N, H, W, C) batch.
+
+        Returns the UI entries and the encode futures to wait on.
+        """
         output_dir = folder_paths.get_temp_directory()
-        results = []
-        for i, tensor in enumerate(images):
-            array = 255.0 * tensor.cpu().numpy()
-            img = Image.fromarray(np.clip(array, 0, 255).astype(np.uint8))
-            ts = int(time.time() * 1000)
-            filename = f"watchpoint_{ts}_{i}.png"
-            img.save(os.path.join(output_dir, filename), compress_level=4)
+        fmt = self.window_manager.settings_manager.get("preview_format", "jpeg")
+        ext = fmt if fmt in ("png", "bmp") else "jpg"
+        uid = next(_PREVIEW_COUNTER)
+        results, pending = [], []
+        for i in range(images.shape[0]):
+            filename = f"watchpoint_{_PREVIEW_SESSION}_{uid}_{i}.{ext}"
+            pending.append(_PREVIEW_POOL.submit(_encode_preview, images[i], os.path.join(output_dir, filename), fmt))
             results.append({"filename": filename, "subfolder": "", "type": "temp"})
-        return results
+        return results, pending
 
     def cleanup(self):
         """Cleanup of WatchPoint node without using atexit"""
@@ -725,6 +978,22 @@ class WatchPoint:
         wp_logger.clear_logs()
         wp_logger.info("Logs cleared", "WatchPoint")
 
+def _resize_image(img, size, scale, box=None, fast=False):
+    """Resizes a PIL image (or the source region box) for display.
+
+    Uses OpenCV's SIMD kernels when available; sub-pixel source boxes go through Pillow.
+    fast trades Lanczos for bilinear filtering while the user is panning or zooming.
+    """
+    if box is None and CV2_AVAILABLE and img.mode in ("RGB", "RGBA", "L"):
+        if scale < 0.5:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LINEAR if fast else cv2.INTER_LANCZOS4
+        return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=interpolation))
+    # reducing_gap box-reduces large downscales first so the filter runs on fewer pixels
+    resample = Image.BILINEAR if fast else Image.LANCZOS
+    return img.resize(size, resample, box=box, reducing_gap=2.0)
+
 # Tkinter UI Classes
 class WatchPointWindow:
     """The main UI for a preview window."""
@@ -743,6 +1012,21 @@ class WatchPointWindow:
         self.fullscreen_active = False
         self.toolbar_visible = self.settings.get("show_toolbar", True)
         self.current_pil_image, self.photo_image = None, None
+        self._resize_cache = (None, None, None)  # (source image, (width, height, box), resized)
+        self._photo_key = None  # (mode, width, height) of self.photo_image
+        self._rgb_cache = (None, None)  # (source image, RGB conversion) for saves and clipboard
+        self._render_pending = False
+        self._render_cropped = False  # Last render only covered the visible region
+        self._scan_drag = False       # Current drag is moving the canvas view in Tk
+        self._interacting = False     # Pan/zoom in progress: render with the fast filter
+        self._resize_fast = False     # Cached resize used the fast filter
+        self._settle_id = None        # after() id of the full-quality render once input stops
+        self._last_frame_ts = 0.0     # perf_counter() of the last new frame shown
+        self._frame_deferred = False  # A capped frame is already scheduled
+        self._last_signal_text = None
+        self._pending_text, self._text_scheduled = None, False  # Latest text awaiting a flush
+        self._geom_cache = {}  # size option -> geometry string for the current monitor
+        self._cw, self._ch = 1, 1  # Canvas size, kept current by <Configure>
         
         self.size_var = tk.StringVar()
         
@@ -754,11 +1038,10 @@ class WatchPointWindow:
     def cleanup_tkinter_resources(self):
         """Safe cleanup of Tkinter resources to prevent destruction errors"""
         # TCL PROTECTION: Only execute in main thread
-        import threading
-        current_thread = threading.current_thread()
+        this_thread = current_thread()
         
-        if current_thread.name != "MainThread":
-            wp_logger.warning(f"Skipping cleanup_tkinter_resources from thread {current_thread.name} - Tcl_AsyncDelete protection", "WatchPointWindow")
+        if this_thread.name != "MainThread":
+            wp_logger.warning(f"Skipping cleanup_tkinter_resources from thread {this_thread.name} - Tcl_AsyncDelete protection", "WatchPointWindow")
             return
         
         try:
@@ -799,6 +1082,8 @@ class WatchPointWindow:
         self.signal_text.pack(fill="both", expand=True)
         self.signal_text.insert("1.0", "Waiting for prompt...")
         self.signal_text.config(state="disabled")
+        # Unlock, replace and relock in one Tcl call; the text is passed as an argument, not spliced
+        self.root.tk.eval("proc wp_set_text {w t} {$w configure -state normal; $w replace 1.0 end $t; $w configure -state disabled}")
 
         # Main Area
         self.main_frame = tk.Frame(self.root, bg='#1a1a1a')
@@ -808,6 +1093,8 @@ class WatchPointWindow:
         
         self.canvas = tk.Canvas(self.main_frame, bg='#000000', highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        # Single persistent image item, updated in place on every render
+        self._canvas_img = self.canvas.create_image(0, 0, anchor=tk.NW)
         
         self._create_context_menu()
 
@@ -846,11 +1133,15 @@ class WatchPointWindow:
             return
 
         try:
-            output = io.BytesIO()
-            # Convert to RGB for BMP format, as RGBA might not be supported.
-            self.current_pil_image.convert("RGB").save(output, "BMP")
-            data = output.getvalue()[14:]  # The BMP header is 14 bytes
-            output.close()
+            # Build a CF_DIB directly: BITMAPINFOHEADER + bottom-up BGR rows padded to 4 bytes
+            bgr = np.asarray(self._as_rgb(self.current_pil_image))[::-1, :, ::-1]
+            h, w, _ = bgr.shape
+            rows = bgr.reshape(h, w * 3)
+            pad = (-w * 3) % 4
+            if pad:
+                rows = np.pad(rows, ((0, 0), (0, pad)))
+            header = struct.pack('<IiiHHIIiiII', 40, w, h, 1, 24, 0, rows.size, 0, 0, 0, 0)
+            data = header + rows.tobytes()
 
             win32clipboard.OpenClipboard()
             win32clipboard.EmptyClipboard()
@@ -866,11 +1157,13 @@ class WatchPointWindow:
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
         self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
         self.canvas.bind("<Button-3>", self._show_context_menu)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
         self.root.bind("<r>", lambda e: self._reset_zoom())
         self.root.bind("<t>", lambda e: self._toggle_toolbar())
         self.root.bind("<p>", lambda e: self._toggle_drawer())
         self.root.bind("<F11>", lambda e: self._toggle_fullscreen())
         self.root.bind("<Escape>", lambda e: self._set_fullscreen(False))
+        self.root.bind("<<ImageReady>>", lambda e: self._check_and_render())
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _set_initial_state(self):
@@ -885,55 +1178,127 @@ class WatchPointWindow:
             self._set_fullscreen(True)
         
         # Process pending text
-        win_data = self.manager.windows.get(self.display_idx, {})
-        if win_data.get("pending_text"):
-            self.update_signal_text(win_data["pending_text"])
-            win_data["pending_text"] = None
+        win_data = self.manager.windows.get(self.display_idx)
+        if win_data and win_data.pending_text:
+            self.update_signal_text(win_data.pending_text)
+            win_data.pending_text = None
+
+    def notify_image(self):
+        """Called from the producer thread after a new image was published."""
+        try:
+            self.root.event_generate("<<ImageReady>>", when="tail")
+        except Exception as e:
+            # The slow liveness loop below still picks the image up
+            wp_logger.debug_lazy(lambda: f"Could not signal new image: {e}", "WatchPointWindow")
+
+    def _check_and_render(self):
+        win_data = self.manager.windows.get(self.display_idx)
+        if not win_data or not win_data.dirty:
+            return
+        # Cap new frames at ~30 fps; the dirty frame stays published, so the latest one wins
+        wait = self._last_frame_ts + 1 / 30 - time.perf_counter()
+        if wait > 0:
+            if not self._frame_deferred:
+                self._frame_deferred = True
+                self.root.after(int(wait * 1000) + 1, self._deferred_render)
+            return
+        with win_data.lock:
+            if not win_data.dirty:
+                return
+            win_data.dirty = False
+            pil_img = win_data.image
+        if pil_img and pil_img is not self.current_pil_image:
+            self.current_pil_image = pil_img
+            self._last_frame_ts = time.perf_counter()
+            self._render_image()
+
+    def _deferred_render(self):
+        self._frame_deferred = False
+        self._check_and_render()
 
     def _update_image_loop(self):
+        # New images arrive via <<ImageReady>>; this loop only watches for shutdown
         win_data = self.manager.windows.get(self.display_idx)
-        if not win_data or not win_data.get("running"):
+        if not win_data or not win_data.running:
             try: self.root.quit()
             except tk.TclError: pass
             return
 
-        with win_data["lock"]:
-            pil_img = win_data.get("image")
-        
-        if pil_img and pil_img != self.current_pil_image:
-            self.current_pil_image = pil_img
-            self._render_image()
-        
-        self.root.after(33, self._update_image_loop)
+        self._check_and_render()
+        self.root.after(250, self._update_image_loop)
 
     def _render_image(self):
         if not self.current_pil_image: return
-        cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
+        cw, ch = self._cw, self._ch
         if cw <= 1: return self.root.after(50, self._render_image)
         
         iw, ih = self.current_pil_image.size
         scale = min(cw/iw, ch/ih) * self.zoom_level if not self.zoom_1to1_active else 1.0
         nw, nh = max(1, int(iw * scale)), max(1, int(ih * scale))
-        
-        resized = self.current_pil_image.resize((nw, nh), Image.LANCZOS)
         xp, yp = (cw - nw)//2 + self.pan_x, (ch - nh)//2 + self.pan_y
         
-        self.photo_image = ImageTk.PhotoImage(resized)
-        self.canvas.delete("all")
-        self.canvas.create_image(xp, yp, anchor=tk.NW, image=self.photo_image)
+        # Zoomed far in: only resample the part of the scaled image that is on the canvas
+        box = None
+        if nw * nh > 4 * cw * ch:
+            dx0, dy0 = max(0, -xp), max(0, -yp)
+            dx1, dy1 = min(nw, cw - xp), min(nh, ch - yp)
+            if dx1 <= dx0 or dy1 <= dy0:
+                # Panned completely out of view; the parked image is stale, so drags must re-render
+                self._render_cropped = True
+                self.canvas.coords(self._canvas_img, cw, ch)
+                return
+            box = (dx0, dy0, dx1, dy1)
+            xp, yp = xp + dx0, yp + dy0
+        self._render_cropped = box is not None
+        
+        # Panning keeps the same size, so reuse the last resample and Tk image
+        src = self.current_pil_image
+        key = (nw, nh, box)
+        cached_src, cached_key, resized = self._resize_cache
+        fast = self._interacting
+        if (cached_src is not src or cached_key != key or self.photo_image is None
+                or (self._resize_fast and not fast)):
+            if box:
+                dx0, dy0, dx1, dy1 = box
+                src_box = (dx0 * iw / nw, dy0 * ih / nh, dx1 * iw / nw, dy1 * ih / nh)
+                resized = _resize_image(src, (dx1 - dx0, dy1 - dy0), scale, box=src_box, fast=fast)
+            else:
+                resized = _resize_image(src, (nw, nh), scale, fast=fast)
+            self._resize_cache = (src, key, resized)
+            self._resize_fast = fast
+            
+            # Same size and mode: blit into the existing Tk image instead of allocating a new one
+            photo_key = (resized.mode,) + resized.size
+            if self.photo_image is not None and self._photo_key == photo_key:
+                self.photo_image.paste(resized)
+            else:
+                self.photo_image = ImageTk.PhotoImage(resized)
+                self._photo_key = photo_key
+                self.canvas.itemconfigure(self._canvas_img, image=self.photo_image)
+        
+        self.canvas.coords(self._canvas_img, xp, yp)
 
     def update_signal_text(self, text):
-        def _update():
-            self.signal_text.config(state="normal")
-            self.signal_text.delete("1.0", tk.END)
-            self.signal_text.insert("1.0", str(text))
-            self.signal_text.config(state="disabled")
-        if self.root.winfo_exists():
-            self.root.after(0, _update)
+        # Bursts collapse into one widget rewrite showing only the latest text
+        self._pending_text = text
+        if not self._text_scheduled and self.root.winfo_exists():
+            self._text_scheduled = True
+            self.root.after(16, self._flush_text)
+
+    def _flush_text(self):
+        self._text_scheduled = False  # Clear first so a concurrent update schedules its own flush
+        text, self._pending_text = self._pending_text, None
+        # Repeated prompts are common; skip the widget rewrite for them
+        if text is None or text == self._last_signal_text:
+            return
+        self._last_signal_text = text
+        self.root.tk.call("wp_set_text", str(self.signal_text), str(text))
 
     # Event Handlers
     def _on_size_change(self, size_str):
-        geom_str = self.manager.calculate_geometry_string(self.root, size_str, 800, 600)
+        geom_str = self._geom_cache.get(size_str)
+        if geom_str is None:
+            geom_str = self._geom_cache[size_str] = self.manager.calculate_geometry_string(self.root, size_str, 800, 600)
         if geom_str: self.root.geometry(geom_str)
 
     def _on_close(self):
@@ -1012,8 +1377,7 @@ class WatchPointWindow:
                 # Try screeninfo first (most reliable)
                 if SCREENINFO_AVAILABLE:
                     try:
-                        from screeninfo import get_monitors
-                        for m in get_monitors():
+                        for m in _cached_monitors():
                             if (m.x <= center_x < m.x + m.width) and (m.y <= center_y < m.y + m.height):
                                 target_monitor = (m.x, m.y, m.width, m.height)
                                 wp_logger.info(f"Fullscreen: Found monitor via screeninfo: {target_monitor}", "WatchPointWindow")
@@ -1169,27 +1533,89 @@ class WatchPointWindow:
         
         f_path = filedialog.asksaveasfilename(defaultextension=ext, filetypes=filetypes)
         if f_path:
+            # Published images are never modified in place, so the worker can use this one directly
+            self.manager.io_pool.submit(self._do_save, self.current_pil_image, f_path, fmt,
+                                        self.settings.get("jpeg_quality", 90))
+
+    def _as_rgb(self, img):
+        """Returns img in RGB mode, converting each source image at most once."""
+        if img.mode == "RGB":
+            return img
+        src, rgb = self._rgb_cache
+        if src is not img:
+            rgb = img.convert("RGB")
+            self._rgb_cache = (img, rgb)
+        return rgb
+
+    def _do_save(self, img, f_path, fmt, quality):
+        """Encodes and writes an image on the save worker; errors are reported on the Tk thread."""
+        try:
+            if fmt == "jpeg":
+                self._as_rgb(img).save(f_path, quality=quality)
+            else:
+                img.save(f_path)
+        except Exception as e:
+            msg = f"Could not save image:\n{e}"
             try:
-                if fmt == "jpeg":
-                    self.current_pil_image.convert("RGB").save(f_path, quality=self.settings.get("jpeg_quality", 90))
-                else:
-                    self.current_pil_image.save(f_path)
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Could not save image:\n{e}")
+                self.root.after(0, lambda: messagebox.showerror("Save Error", msg))
+            except Exception:
+                wp_logger.error(msg, "SaveImage")
 
     def _open_settings(self): WatchPointSettingsDialog(self.root, self.settings, self)
-    def _on_mouse_wheel(self, e): self._zoom_in() if e.delta > 0 else self._zoom_out()
-    def _on_mouse_down(self, e): self.is_dragging, self.drag_start_x, self.drag_start_y = True, e.x, e.y
-    def _on_mouse_up(self, e): self.is_dragging = False
+    def _on_mouse_wheel(self, e):
+        # Wheel ticks only update the zoom; a burst within one loop pass renders once
+        self._mark_interacting(); self._apply_zoom(1.2 if e.delta > 0 else 1/1.2)
+        self._schedule_render()
+    def _on_mouse_down(self, e):
+        self.is_dragging, self.drag_start_x, self.drag_start_y = True, e.x, e.y
+        # A fully rendered image can be dragged by Tk itself; a cropped one needs re-rendering
+        self._scan_drag = not self._render_cropped
+        if self._scan_drag: self.canvas.scan_mark(e.x, e.y)
+    def _on_mouse_up(self, e):
+        self.is_dragging = False
+        if self._scan_drag:
+            # Fold the scrolled view offset back into pan_x/pan_y and reset the view
+            ox, oy = int(self.canvas.canvasx(0)), int(self.canvas.canvasy(0))
+            self._scan_drag = False
+            if ox or oy:
+                self.pan_x -= ox
+                self.pan_y -= oy
+                self.canvas.scan_mark(0, 0)
+                self.canvas.scan_dragto(ox, oy, gain=1)
+                self._render_image()
     def _show_context_menu(self, e): self.context_menu.tk_popup(e.x_root, e.y_root)
     def _on_mouse_drag(self, e):
-        if self.is_dragging:
+        if self.is_dragging and self._scan_drag:
+            self.canvas.scan_dragto(e.x, e.y, gain=1)
+        elif self.is_dragging:
             self.pan_x += e.x - self.drag_start_x
             self.pan_y += e.y - self.drag_start_y
             self.drag_start_x, self.drag_start_y = e.x, e.y
-            self._render_image()
-    def _zoom_in(self): self.zoom_1to1_active=False; self.zoom_level=min(10.0,self.zoom_level*1.2); self._render_image()
-    def _zoom_out(self): self.zoom_1to1_active=False; self.zoom_level=max(0.1,self.zoom_level/1.2); self._render_image()
+            self._mark_interacting()
+            self._schedule_render()
+    def _mark_interacting(self):
+        # Renders use the fast filter until input has been quiet for 200 ms
+        self._interacting = True
+        if self._settle_id: self.root.after_cancel(self._settle_id)
+        self._settle_id = self.root.after(200, self._settle_render)
+    def _settle_render(self):
+        self._settle_id, self._interacting = None, False
+        if self._resize_fast: self._render_image()
+    def _on_canvas_resize(self, event):
+        if (event.width, event.height) != (self._cw, self._ch):
+            self._cw, self._ch = event.width, event.height
+            self._schedule_render()
+    def _schedule_render(self):
+        # Collapse a burst of motion events into one render per event-loop pass
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self._do_render)
+    def _do_render(self):
+        self._render_pending = False
+        self._render_image()
+    def _apply_zoom(self, factor): self.zoom_1to1_active=False; self.zoom_level=max(0.1,min(10.0,self.zoom_level*factor))
+    def _zoom_in(self): self._apply_zoom(1.2); self._render_image()
+    def _zoom_out(self): self._apply_zoom(1/1.2); self._render_image()
     def _zoom_1to1(self): self.zoom_1to1_active=True; self.pan_x=0; self.pan_y=0; self._render_image()
     def _reset_zoom(self): self.zoom_1to1_active=False; self.zoom_level=1.0; self.pan_x=0; self.pan_y=0; self._render_image()
 
@@ -1215,7 +1641,7 @@ class WatchPointSettingsDialog:
         # Monitor Selection
         if SCREENINFO_AVAILABLE:
             try:
-                monitors = [f"Monitor {i} ({m.width}x{m.height})" for i, m in enumerate(get_monitors())]
+                monitors = [f"Monitor {i} ({m.width}x{m.height})" for i, m in enumerate(_cached_monitors())]
                 if monitors:
                     m_frame = tk.LabelFrame(frame, text="Monitor", padx=10, pady=10)
                     m_frame.pack(anchor="w", fill="x", pady=(0, 10))